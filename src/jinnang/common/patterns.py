@@ -6,7 +6,8 @@ Factory, and other structural patterns that can be reused throughout the applica
 
 import os
 import logging
-from typing import TypeVar, Type, Dict, Any, Optional, List, ClassVar
+import weakref
+from typing import TypeVar, Type, Any, Optional, List, ClassVar
 
 from jinnang.verbosity.verbosity import Verbosity
 
@@ -23,8 +24,11 @@ class Singleton:
     Example:
         ```python
         class MyManager(Singleton):
+            _initialized = False
+
             def __init__(self, config=None):
-                if not hasattr(self, '_initialized'):
+                super().__init__(config=config)
+                if not self._initialized:
                     self.config = config or {}
                     self._initialized = True
                 
@@ -34,19 +38,52 @@ class Singleton:
         same_manager = MyManager.get_instance()
         assert manager is same_manager  # True
         ```
+
+        Alternatively, put one-time setup in ``_singleton_init``, which runs
+        exactly once when the instance is created, with the arguments of that
+        first construction, so no initialization flag is needed:
+
+        ```python
+        class MyCache(Singleton):
+            def _singleton_init(self, size=128):
+                self.size = size
+        ```
     """
     
-    # Class variable to store singleton instances
-    _instances: ClassVar[Dict[Type['Singleton'], 'Singleton']] = {}
+    # Registry of classes that currently hold a singleton instance. Held
+    # weakly so dynamically created subclasses, together with the instance
+    # cached on them, can be garbage-collected once nothing else uses them.
+    _singleton_classes: ClassVar['weakref.WeakSet[Type[Singleton]]'] = weakref.WeakSet()
+    # Empty, so Singleton still mixes with builtins such as dict or Exception.
+    # Subclasses that also declare __slots__ get instances without a __dict__;
+    # they keep the re-initialization check only if they list
+    # '_initialized_with_params' among their own slots.
+    __slots__ = ()
+    # Class-level default so the re-initialization check needs no per-instance setup.
+    _initialized_with_params: bool = False
 
     def __new__(cls: Type[T], *args: Any, **kwargs: Any) -> T:
-        if cls not in cls._instances:
+        # Each subclass caches its own instance in its class __dict__ (not
+        # inherited), so the hot path is one attribute-dict lookup.
+        instance = cls.__dict__.get('_singleton_instance')
+        if instance is None:
             instance = super().__new__(cls)
-            cls._instances[cls] = instance
-        return cls._instances[cls]
+            instance._singleton_init(*args, **kwargs)
+            # Registered only after _singleton_init succeeds, so a failed first
+            # construction does not leave a half-initialized singleton behind.
+            cls._singleton_instance = instance
+            cls._singleton_classes.add(cls)
+        return instance
+
+    def _singleton_init(self, *args: Any, **kwargs: Any) -> None:
+        """One-shot initialization hook, called only when the instance is created.
+
+        Receives the arguments of the first construction. The default does nothing.
+        """
 
     def __init__(self, *args: Any, **kwargs: Any):
         # This __init__ is to check for re-initialization with different params.
+        # getattr: a subclass-declared slot shadows the class default until set.
         if getattr(self, '_initialized_with_params', False):
             if args or kwargs:
                 raise TypeError(
@@ -61,7 +98,22 @@ class Singleton:
 
         # Mark as initialized with params if any are provided.
         if args or kwargs:
-            self._initialized_with_params = True
+            try:
+                self._initialized_with_params = True
+            except AttributeError:
+                pass  # slotted subclass without the slot: check opted out
+
+    @classmethod
+    def _reset_for_tests(cls) -> None:
+        """Forget every singleton instance, mutating the shared registry in place.
+
+        Intended for test isolation only; live references to old instances are
+        unaffected, but subsequent constructor calls create fresh ones.
+        """
+        for klass in list(cls._singleton_classes):
+            if '_singleton_instance' in klass.__dict__:
+                del klass._singleton_instance
+        cls._singleton_classes.clear()
 
     @classmethod
     def get_instance(cls: Type[T], *args: Any, **kwargs: Any) -> T:
@@ -79,6 +131,7 @@ class Singleton:
                 "  s1 = MySingleton(value='foo')             # OK\n"
                 "  s2 = MySingleton.get_instance()          # OK"
             )
-        if cls not in cls._instances:
+        instance = cls.__dict__.get('_singleton_instance')
+        if instance is None:
             return cls()
-        return cls._instances[cls]
+        return instance
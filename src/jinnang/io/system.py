@@ -4,7 +4,7 @@ import shutil
 import contextlib
 import threading
 from io import StringIO
-from typing import Optional, Union
+from typing import Optional, Tuple, Union
 from pathlib import Path
 
 import logging
@@ -17,6 +17,41 @@ PathType = Union[str, Path]
 # Global thread-local storage for suppress_c_stdout_stderr
 _suppress_thread_local = threading.local()
 
+# /dev/null descriptor shared by every suppress_c_stdout_stderr call, and the
+# (st_dev, st_ino) identity it had when opened
+_devnull_fd: Optional[int] = None
+_devnull_id: Optional[Tuple[int, int]] = None
+_devnull_lock = threading.Lock()
+
+
+def _devnull_fd_is_valid() -> bool:
+    """Whether the cached fd is still open on /dev/null.
+
+    Other code may close it (e.g. ``os.closerange`` after a fork or when
+    daemonizing) and the number may be reused for an unrelated file, which
+    ``dup2`` would then send stdout/stderr to.
+    """
+    if _devnull_fd is None:
+        return False
+    try:
+        st = os.fstat(_devnull_fd)
+    except OSError:
+        return False
+    return (st.st_dev, st.st_ino) == _devnull_id
+
+
+def _get_devnull_fd() -> int:
+    """Return a write-only /dev/null descriptor, reopened only if it went stale."""
+    global _devnull_fd, _devnull_id
+    if not _devnull_fd_is_valid():
+        with _devnull_lock:
+            if not _devnull_fd_is_valid():
+                # The stale number is not closed: it may now belong to someone else
+                fd = os.open(os.devnull, os.O_WRONLY)
+                st = os.fstat(fd)
+                _devnull_fd, _devnull_id = fd, (st.st_dev, st.st_ino)
+    return _devnull_fd
+
 @contextlib.contextmanager
 def suppress_c_stdout_stderr(suppress_stdout=True, suppress_stderr=False):
     """
@@ -25,6 +60,14 @@ def suppress_c_stdout_stderr(suppress_stdout=True, suppress_stderr=False):
     This implementation is thread-safe and handles async/recursive scenarios properly
     by ensuring file descriptors are always restored even in exceptional cases.
     
+    Thread safety: file descriptors 1 and 2 are process-wide, so the whole
+    ``with`` block runs under a process-global re-entrant lock. Only one thread
+    is suppressed at a time; other threads entering the context wait until it
+    exits. Output written by threads that do not use the context while another
+    thread is inside it is discarded as well. Nested contexts in the same thread
+    only bump a depth counter and keep the outermost redirection, so their
+    ``suppress_stdout``/``suppress_stderr`` arguments are ignored.
+    
     Args:
         suppress_stdout: Whether to suppress stdout (default: True)
         suppress_stderr: Whether to suppress stderr (default: False)
@@ -37,12 +80,11 @@ def suppress_c_stdout_stderr(suppress_stdout=True, suppress_stderr=False):
         # Initialize thread-local storage if needed
         if not hasattr(_suppress_thread_local, 'nesting_level'):
             _suppress_thread_local.nesting_level = 0
-            _suppress_thread_local.active_suppressions = []
         
         _suppress_thread_local.nesting_level += 1
         current_level = _suppress_thread_local.nesting_level
         
-        # Only redirect at the first level to avoid conflicts
+        # Only redirect at the first level; nested entries touch no fds
         if current_level > 1:
             try:
                 yield
@@ -58,13 +100,14 @@ def suppress_c_stdout_stderr(suppress_stdout=True, suppress_stderr=False):
             # Handle cases where stdout/stderr might be closed or invalid
             pass
         
-        # Store original file descriptors
+        # Store original file descriptors. They are duplicated on every
+        # outermost entry rather than once per process, since fds 1/2 may be
+        # re-pointed between calls (e.g. by a test runner's output capture).
         redirected_fds = {}
-        null_fd = None
         
         try:
-            # Open /dev/null once and reuse
-            null_fd = os.open(os.devnull, os.O_WRONLY)
+            # Reuse the process-wide /dev/null descriptor
+            null_fd = _get_devnull_fd()
             
             # Redirect stdout if requested
             if suppress_stdout:
@@ -111,44 +154,6 @@ def suppress_c_stdout_stderr(suppress_stdout=True, suppress_stderr=False):
             # Execute the wrapped code
             yield
             
-        except Exception as e:
-            # Handle any setup errors
-            # Restore file descriptors if any were redirected
-            restoration_errors = []
-            
-            # Restore stderr first, then stdout (reverse order)
-            for stream_name in ['stderr', 'stdout']:
-                if stream_name in redirected_fds:
-                    fd_info = redirected_fds[stream_name]
-                    try:
-                        # Restore the original file descriptor
-                        os.dup2(fd_info['original'], fd_info['target'])
-                    except OSError as restore_e:
-                        restoration_errors.append(f"Failed to restore {stream_name}: {restore_e}")
-                    
-                    try:
-                        # Close the duplicated file descriptor
-                        os.close(fd_info['original'])
-                    except OSError as close_e:
-                        restoration_errors.append(f"Failed to close {stream_name} backup fd: {close_e}")
-            
-            # Close /dev/null file descriptor
-            if null_fd is not None:
-                try:
-                    os.close(null_fd)
-                except OSError as null_e:
-                    restoration_errors.append(f"Failed to close /dev/null fd: {null_e}")
-            
-            # Reset nesting level
-            _suppress_thread_local.nesting_level -= 1
-            
-            # Log any restoration errors
-            if restoration_errors:
-                print(f"Warning: File descriptor restoration errors during exception: {'; '.join(restoration_errors)}")
-            
-            # Re-raise the original exception
-            raise
-        
         finally:
             # Restore file descriptors in reverse order with robust error handling
             restoration_errors = []
@@ -169,13 +174,6 @@ def suppress_c_stdout_stderr(suppress_stdout=True, suppress_stderr=False):
                     except OSError as e:
                         restoration_errors.append(f"Failed to close {stream_name} backup fd: {e}")
             
-            # Close /dev/null file descriptor
-            if null_fd is not None:
-                try:
-                    os.close(null_fd)
-                except OSError as e:
-                    restoration_errors.append(f"Failed to close /dev/null fd: {e}")
-            
             # Reset nesting level
             _suppress_thread_local.nesting_level -= 1
             
@@ -1,10 +1,13 @@
 """Module for handling video resolution presets."""
 
+import math
+from collections import namedtuple
 from enum import Enum, unique
-from functools import total_ordering
+
+# Member value type: a (width, height) tuple that also allows named access.
+_Dim = namedtuple('_Dim', 'width height')
 
 @unique
-@total_ordering
 class ResolutionPreset(Enum):
     """Standard video resolution presets with exact dimensions.
     
@@ -26,27 +29,31 @@ class ResolutionPreset(Enum):
         width, height = ResolutionPreset.RES_1080P.value
         ```
     """
-    ORIGINAL = (None, None)
+    ORIGINAL = _Dim(None, None)
 
-    RES_4K = (3840, 2160)
-    RES_2K = (2560, 1440)
-    RES_1080P = (1920, 1080)
-    RES_720P = (1280, 720)
-    RES_540P = (960, 540)
-    RES_480P = (854, 480)
-    RES_360P = (640, 360)
-    RES_240P = (426, 240)
+    RES_4K = _Dim(3840, 2160)
+    RES_2K = _Dim(2560, 1440)
+    RES_1080P = _Dim(1920, 1080)
+    RES_720P = _Dim(1280, 720)
+    RES_540P = _Dim(960, 540)
+    RES_480P = _Dim(854, 480)
+    RES_360P = _Dim(640, 360)
+    RES_240P = _Dim(426, 240)
+
+    RES_144P = _Dim(256, 144)       # Common low-quality streaming
+    RES_120P = _Dim(160, 120)       # Old webcam/QQVGA standard
+    RES_96P = _Dim(128, 96)         # Very low-res, sometimes for thumbnails
+    RES_80P = _Dim(160, 80)         # Ultra-low bandwidth (e.g., IoT devices)
+    RES_64P = _Dim(64, 64)          # Tiny (e.g., placeholder icons)
+    RES_48P = _Dim(48, 48)          # Extremely small (practically unusable for video)
+    RES_32P = _Dim(32, 32)          # Thumbnail/legacy icon size
+    RES_16P = _Dim(16, 16)          # Smallest usable (favicon-sized)
+
+    def __init__(self, width, height):
+        # Ordering key, precomputed once per member: total pixel count, with
+        # ORIGINAL ranked above every concrete resolution.
+        self._rank = math.inf if width is None else width * height
 
-    RES_144P = (256, 144)       # Common low-quality streaming
-    RES_120P = (160, 120)       # Old webcam/QQVGA standard
-    RES_96P = (128, 96)         # Very low-res, sometimes for thumbnails
-    RES_80P = (160, 80)         # Ultra-low bandwidth (e.g., IoT devices)
-    RES_64P = (64, 64)          # Tiny (e.g., placeholder icons)
-    RES_48P = (48, 48)          # Extremely small (practically unusable for video)
-    RES_32P = (32, 32)          # Thumbnail/legacy icon size
-    RES_16P = (16, 16)          # Smallest usable (favicon-sized)
-    
-    
     @classmethod
     def from_string(cls, value: str) -> 'Resolution':
         """Initialize from shorthand notation like '1080p' or '4k'"""
@@ -69,11 +76,11 @@ class ResolutionPreset(Enum):
 
     @property
     def width(self) -> int:
-        return self.value[0]
+        return self.value.width
     
     @property
     def height(self) -> int:
-        return self.value[1]
+        return self.value.height
     
     def __repr__(self) -> str:
         return f"{self.name} ({self.width}x{self.height})"
@@ -86,12 +93,19 @@ class ResolutionPreset(Enum):
     def __lt__(self, other):
         if not isinstance(other, ResolutionPreset):
             return NotImplemented
-        if self.value == (None, None):
-            return False  # ORIGINAL is always largest
-        if other.value == (None, None):
-            return True  # Any other resolution is less than ORIGINAL
+        return self._rank < other._rank
 
-        # Compare based on total pixel count (width * height)
-        self_pixels = self.value[0] * self.value[1]
-        other_pixels = other.value[0] * other.value[1]
-        return self_pixels < other_pixels
\ No newline at end of file
+    def __le__(self, other):
+        if not isinstance(other, ResolutionPreset):
+            return NotImplemented
+        return self._rank <= other._rank
+
+    def __gt__(self, other):
+        if not isinstance(other, ResolutionPreset):
+            return NotImplemented
+        return self._rank > other._rank
+
+    def __ge__(self, other):
+        if not isinstance(other, ResolutionPreset):
+            return NotImplemented
+        return self._rank >= other._rank
\ No newline at end of file
@@ -9,7 +9,7 @@ from typing import TypeVar
 
 from jinnang.common.hash import partial_file_hash
 from jinnang.verbosity.verbosity import Verbosity
-from typing import TypeVar, Type, Dict, Any, Optional, List, ClassVar
+from typing import TypeVar, Type, Dict, Any, Optional, List, ClassVar, Tuple
 
 T = TypeVar('T')
 
@@ -33,6 +33,67 @@ def ensure_unique_path(func):
     return wrapper
 
 
+def _max_verbosity_from_env(environ=os.environ) -> Verbosity:
+    """Reads the process-wide verbosity ceiling from ``JINNANG_MAX_VERBOSITY``.
+
+    The value is a ``Verbosity`` name (case-insensitive); unset or unknown
+    values impose no ceiling.
+    """
+    name = environ.get("JINNANG_MAX_VERBOSITY", "").upper()
+    return Verbosity.__members__.get(name, max(Verbosity))
+
+
+_MAX_VERBOSITY = _max_verbosity_from_env()
+
+
+def _noop(*args, **kwargs):
+    return None
+
+
+def _debug_detail(verbosity: Verbosity, msg: str, *args: Any) -> None:
+    if verbosity >= Verbosity.DETAIL and logging.getLogger().isEnabledFor(logging.DEBUG):
+        logging.debug(msg, *args)
+
+
+def _info_once(verbosity: Verbosity, msg: str, *args: Any) -> None:
+    if verbosity >= Verbosity.ONCE:
+        logging.info(msg, *args)
+
+
+def _error_once(verbosity: Verbosity, msg: str, *args: Any) -> None:
+    if verbosity >= Verbosity.ONCE:
+        logging.error(msg, *args)
+
+
+def _log_helpers(max_verbosity: Verbosity) -> Tuple[Any, Any, Any]:
+    """Returns the (debug detail, info once, error once) helpers for a ceiling.
+
+    Levels above ``max_verbosity`` get a no-op, so callers pay a single
+    function call instead of re-checking the ceiling on every message.
+    """
+    return (
+        _debug_detail if max_verbosity >= Verbosity.DETAIL else _noop,
+        _info_once if max_verbosity >= Verbosity.ONCE else _noop,
+        _error_once if max_verbosity >= Verbosity.ONCE else _noop,
+    )
+
+
+# Bound once at import from JINNANG_MAX_VERBOSITY
+_log_debug_detail, _log_info_once, _log_error_once = _log_helpers(_MAX_VERBOSITY)
+
+
+@functools.lru_cache(maxsize=128)
+def _search_dirs(module_path: str, cwd: str = '.') -> Tuple[str, ...]:
+    """Directories searched for files relative to ``module_path``, in priority order."""
+    module_dir = os.path.dirname(module_path)
+    return (
+        module_dir,
+        os.path.join(module_dir, '..'),
+        os.path.join(module_dir, '../..'),
+        cwd
+    )
+
+
 class RelPathSeeker:
     """
     A utility class for resolving file paths relative to a calling module.
@@ -66,6 +127,7 @@ class RelPathSeeker:
         filename: Optional[str] = None,
         caller_module_path: Optional[str] = None,
         verbosity: Verbosity = Verbosity.FULL,
+        cwd: Optional[str] = None,
         **kwargs: Any
     ):
         if not (filename or caller_module_path):
@@ -77,7 +139,8 @@ class RelPathSeeker:
             self.loaded_filepath = self.resolve_file_path(
                 filename=filename,
                 caller_module_path=caller_module_path,
-                verbosity=verbosity
+                verbosity=verbosity,
+                cwd=cwd
             )
         except FileNotFoundError:
             self.loaded_filepath = None
@@ -90,7 +153,8 @@ class RelPathSeeker:
     def _get_search_paths(
         filename: str = "",
         caller_module_path: Optional[str] = None,
-        verbosity: Verbosity = Verbosity.FULL
+        verbosity: Verbosity = Verbosity.FULL,
+        cwd: Optional[str] = None
     ) -> List[str]:
         """Generates a list of potential file paths based on the caller's module path.
 
@@ -102,39 +166,45 @@ class RelPathSeeker:
             caller_module_path (Optional[str]): The `__file__` attribute of the
                 calling module, used to determine a relative search path.
             verbosity (Verbosity): The verbosity level for logging.
+            cwd (Optional[str]): Directory used as the last search location
+                instead of the process working directory ('.').
 
         Returns:
             List[str]: A list of absolute paths where the file might exist,
             ordered by search priority.
         """
-        module_path = caller_module_path or __file__
-        locations = [
-            os.path.dirname(module_path),
-            os.path.join(os.path.dirname(module_path), '..'),
-            os.path.join(os.path.dirname(module_path), '../..'),
-            '.'
-        ]
+        locations = _search_dirs(
+            os.fspath(caller_module_path or __file__),
+            '.' if cwd is None else os.fspath(cwd)
+        )
         potential_paths = [os.path.join(directory, filename) for directory in locations]
-        if verbosity >= Verbosity.DETAIL:
-            logging.debug(f"Potential search paths for '{filename}': {potential_paths}")
+        _log_debug_detail(
+            verbosity, "Potential search paths for '%s': %s", filename, potential_paths
+        )
         return potential_paths
 
     @staticmethod
     def resolve_file_path(
         filename: str = "",
         caller_module_path: Optional[str] = None,
-        verbosity: Verbosity = Verbosity.FULL
+        verbosity: Verbosity = Verbosity.FULL,
+        cwd: Optional[str] = None
     ) -> str:
         """Resolves the absolute path to a file based on the caller's module path.
 
         This static method attempts to find a file by searching through a series
-        of prioritized locations relative to the calling module.
+        of prioritized locations relative to the calling module. The search
+        directories are cached per caller; the files themselves are probed on
+        every call, so files created or removed since a previous call are seen.
 
         Args:
             filename (str): The name of the file to resolve.
             caller_module_path (Optional[str]): The `__file__` attribute of the
                 calling module, used to determine a relative search path.
             verbosity (Verbosity): The verbosity level for logging.
+            cwd (Optional[str]): Directory used as the last search location
+                instead of the process working directory, so callers need
+                not ``os.chdir``.
 
         Returns:
             str: The absolute path to the resolved file.
@@ -143,38 +213,68 @@ class RelPathSeeker:
             FileNotFoundError: If the file cannot be found in any of the specified
                 or default search locations.
         """
-        if verbosity >= Verbosity.DETAIL:
-            logging.debug(f"Searching for filename: {filename}")
+        _log_debug_detail(verbosity, "Searching for filename: %s", filename)
 
         potential_paths = RelPathSeeker._get_search_paths(
             filename=filename,
             caller_module_path=caller_module_path,
-            verbosity=verbosity
+            verbosity=verbosity,
+            cwd=cwd
         )
 
+        # isfile() already implies existence: one stat per candidate.
         for potential_path in potential_paths:
-
-            if os.path.exists(potential_path) and os.path.isfile(potential_path):
-                if verbosity >= Verbosity.ONCE:
-                    logging.info(f"Found file: {potential_path}")
+            if os.path.isfile(potential_path):
+                _log_info_once(verbosity, "Found file: %s", potential_path)
                 return potential_path
 
         error_message = f"Could not find {filename} in any of these locations: {potential_paths}"
-        if verbosity >= Verbosity.ONCE:
-            logging.error(error_message)
+        _log_error_once(verbosity, error_message)
         raise FileNotFoundError(error_message)
 
+def _slot_cached_property(slot):
+    """Like ``functools.cached_property`` but stores the value in a ``__slots__`` slot."""
+    def decorator(func):
+        @functools.wraps(func)
+        def getter(self):
+            try:
+                return getattr(self, slot)
+            except AttributeError:
+                value = func(self)
+                setattr(self, slot, value)
+                return value
+        return property(getter)
+    return decorator
+
 class MyPath:
+    # No per-instance __dict__: MyPath objects are created in bulk when
+    # enumerating files, so keep them small. Pure string-derived properties
+    # are memoized into the extra slots on first access.
+    __slots__ = ('_path', '_basename', '_extension')
 
     def __init__(self, path):
-        self.path = path
+        self._path = path
 
     @property
+    def path(self):
+        return self._path
+
+    @path.setter
+    def path(self, path):
+        # Drop the values memoized from the previous path
+        for slot in ('_basename', '_extension'):
+            try:
+                delattr(self, slot)
+            except AttributeError:
+                pass
+        self._path = path
+
+    @_slot_cached_property('_basename')
     def basename(self):
         """ Extracts the basename from a given file path. """
         return os.path.splitext(os.path.basename(self.path))[0]
 
-    @property
+    @_slot_cached_property('_extension')
     def extension(self):
         """ Extracts the extension from a given file path, without the dot. """
         return os.path.splitext(self.path)[1][1:]
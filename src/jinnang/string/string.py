@@ -1,15 +1,35 @@
 
+import functools
+import re
 import unicodedata
 from string import Formatter
-from typing import Optional
+from typing import Optional, Tuple
 
 
 def get_numeric(value):
     """Convert value to float if possible, else return None."""
+    if type(value) is str:
+        return _parse_numeric_str(value)
     try:
         return float(value) if value is not None else None
     except (ValueError, TypeError):
         return None
+
+
+# float() only accepts strings containing a digit (any Unicode Nd) or an
+# inf/nan spelling; anything else is rejected without raising ValueError.
+_MAYBE_NUMERIC = re.compile(r'\d|inf|nan', re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_numeric_str(text: str) -> Optional[float]:
+    """``get_numeric`` for exact ``str`` inputs, memoized since such strings recur."""
+    if not _MAYBE_NUMERIC.search(text):
+        return None
+    try:
+        return float(text)
+    except ValueError:
+        return None
     
 
 def get_int(value, default=0):
@@ -33,17 +53,42 @@ def safe_format(template: str, data: dict) -> str:
         >>> safe_format('a {haha}', {'haha': 1, 'eheh': 2})
         'a 1'
     """
-    required_keys = [fn for _, fn, _, _ in Formatter().parse(template) if fn is not None]
-    filtered_data = {k: data[k] for k in required_keys if k in data}
+    filtered_data = {k: data[k] for k in _template_fields(template) if k in data}
     return template.format(**filtered_data)
 
 
+@functools.lru_cache(maxsize=256)
+def _template_fields(template: str) -> Tuple[str, ...]:
+    """Placeholder field names of ``template``, parsed once per distinct template."""
+    return tuple(dict.fromkeys(
+        fn for _, fn, _, _ in Formatter().parse(template) if fn is not None
+    ))
+
+
+_SPECIAL_CATEGORIES = frozenset({'So', 'Cn', 'Co'})
+
+
+class _SpecialCharTable(dict):
+    """``str.translate`` table mapping special code points to ``None``.
+
+    Entries are filled lazily on first sight of each code point, so memory is
+    bounded by the characters actually seen rather than the ~1M code points
+    in Unicode, and repeat characters are a plain C-level dict hit.
+    """
+
+    def __missing__(self, codepoint: int) -> Optional[int]:
+        category = unicodedata.category(chr(codepoint))
+        value = None if category in _SPECIAL_CATEGORIES else codepoint
+        self[codepoint] = value
+        return value
+
+
+_SPECIAL_CHAR_TABLE = _SpecialCharTable()
+
+
 def remove_special_chars(text: str) -> str:
     """Remove characters with Unicode categories So, Cn, Co from a string."""
-    return ''.join(
-        char for char in text 
-        if unicodedata.category(char) not in {'So', 'Cn', 'Co'}
-    )
+    return text.translate(_SPECIAL_CHAR_TABLE)
 
 
 def truncate(s: str, max_length: int) -> str:
@@ -0,0 +1,17 @@
+"""Helpers shared by the test modules."""
+
+import os
+import unittest
+
+# Thread-heavy and timing-based tests, opted into with JINNANG_STRESS=1
+stress_test = unittest.skipUnless(os.environ.get("JINNANG_STRESS"),
+                                  "stress test; set JINNANG_STRESS=1")
+
+
+def touch(path, data=b""):
+    """Create ``path`` holding ``data`` through a raw fd, skipping buffered text I/O."""
+    fd = os.open(path, os.O_CREAT | os.O_WRONLY | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
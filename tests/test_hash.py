@@ -1,3 +1,4 @@
+import contextlib
 import unittest
 import tempfile
 import os
@@ -14,7 +15,7 @@ class TestHashFunctions(unittest.TestCase):
         
     def tearDown(self):
         """Clean up after each test method."""
-        if os.path.exists(self.test_file_path):
+        with contextlib.suppress(FileNotFoundError):
             os.remove(self.test_file_path)
         os.rmdir(self.temp_dir)
 
@@ -1,5 +1,7 @@
+import contextlib
 import unittest
 import os
+import shutil
 import tempfile
 import time
 from unittest.mock import patch, MagicMock
@@ -8,24 +10,25 @@ import pytz
 
 from jinnang.path.path import MyPath, ensure_unique_path, get_file_timestamp
 
+from tests.helpers import touch
+
 
 class TestPathUtilities(unittest.TestCase):
     """Test cases for path utility functions."""
 
-    def setUp(self):
-        """Set up test fixtures before each test method."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.test_file_path = os.path.join(self.temp_dir, "test_file.txt")
+    @classmethod
+    def setUpClass(cls):
+        """Create the read-only test file once for the whole class."""
+        cls.temp_dir = tempfile.mkdtemp()
+        cls.test_file_path = os.path.join(cls.temp_dir, "test_file.txt")
         
         # Create a test file
-        with open(self.test_file_path, "w") as f:
-            f.write("Test content")
+        touch(cls.test_file_path, b"Test content")
         
-    def tearDown(self):
-        """Clean up after each test method."""
-        if os.path.exists(self.test_file_path):
-            os.remove(self.test_file_path)
-        os.rmdir(self.temp_dir)
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the class fixture directory."""
+        shutil.rmtree(cls.temp_dir, ignore_errors=True)
 
     def test_my_path_basename(self):
         """Test MyPath basename property."""
@@ -38,6 +41,14 @@ class TestPathUtilities(unittest.TestCase):
         path = MyPath("/path/to/file.name.with.dots.txt")
         self.assertEqual(path.basename, "file.name.with.dots")
 
+    def test_my_path_reassigned_path(self):
+        """Test MyPath properties follow a reassigned path."""
+        path = MyPath("/a/b.txt")
+        self.assertEqual((path.basename, path.extension), ("b", "txt"))
+        path.path = "/c/d.py"
+        self.assertEqual(path.path, "/c/d.py")
+        self.assertEqual((path.basename, path.extension), ("d", "py"))
+
     def test_my_path_extension(self):
         """Test MyPath extension property."""
         path = MyPath("/path/to/file.txt")
@@ -49,6 +60,18 @@ class TestPathUtilities(unittest.TestCase):
         path = MyPath("/path/to/file.name.with.dots.txt")
         self.assertEqual(path.extension, "txt")
 
+    def test_my_path_slots(self):
+        """Test MyPath uses __slots__ and memoizes derived properties."""
+        path = MyPath("/path/to/file.txt")
+        self.assertFalse(hasattr(path, "__dict__"))
+        with self.assertRaises(AttributeError):
+            path.unexpected_attribute = 1
+
+        self.assertEqual(path.basename, "file")
+        self.assertEqual(path.extension, "txt")
+        self.assertEqual(path._basename, "file")
+        self.assertEqual(path._extension, "txt")
+
     def test_my_path_abspath(self):
         """Test MyPath abspath property."""
         # Test with relative path
@@ -161,8 +184,7 @@ class TestPathUtilities(unittest.TestCase):
         self.assertIn("-1", unique_path)  # Should append -1 to make it unique
         
         # Create the file returned by the first call
-        with open(unique_path, "w") as f:
-            f.write("Another test file")
+        touch(unique_path, b"Another test file")
             
         try:
             # Second call should return a different path
@@ -172,7 +194,7 @@ class TestPathUtilities(unittest.TestCase):
             self.assertIn("-2", second_unique_path)  # Should append -2
         finally:
             # Clean up the additional file
-            if os.path.exists(unique_path):
+            with contextlib.suppress(FileNotFoundError):
                 os.remove(unique_path)
 
     def test_ensure_unique_path_with_none(self):
@@ -14,6 +14,9 @@ class TestResolutionPreset(unittest.TestCase):
         self.assertEqual(ResolutionPreset.RES_360P.value, (640, 360))
         self.assertEqual(ResolutionPreset.RES_240P.value, (426, 240))
         self.assertEqual(ResolutionPreset.RES_16P.value, (16, 16))
+        # Values are (width, height) tuples that also allow named access
+        self.assertEqual(ResolutionPreset.RES_1080P.value.width, 1920)
+        self.assertEqual(ResolutionPreset.RES_1080P.value.height, 1080)
     
     def test_equality_comparison(self):
         # Test equality comparison
@@ -100,11 +103,11 @@ class TestResolutionPreset(unittest.TestCase):
             ResolutionPreset.ORIGINAL
         ]
         
-        # Check that each resolution is greater than all previous resolutions
-        for i in range(1, len(resolutions)):
-            for j in range(i):
-                self.assertGreater(resolutions[i], resolutions[j])
-                self.assertLess(resolutions[j], resolutions[i])
+        # Adjacent pairs suffice: the ordering is transitive by construction
+        for smaller, larger in zip(resolutions, resolutions[1:]):
+            self.assertLess(smaller, larger)
+            self.assertGreater(larger, smaller)
+        self.assertEqual(sorted(reversed(resolutions)), resolutions)
     
     def test_enum_iteration(self):
         # Test that we can iterate through all resolution presets
@@ -42,6 +42,24 @@ class TestStringUtilities(unittest.TestCase):
                 result = get_numeric(invalid_input)
                 self.assertIsNone(result)
 
+    def test_get_numeric_accepts_full_float_syntax(self):
+        """Test get_numeric accepts everything float() does, including repeats."""
+        test_cases = [
+            (" 42 ", 42.0),
+            ("+1", 1.0),
+            (".5", 0.5),
+            ("5.", 5.0),
+            ("1_000", 1000.0),
+            ("-inf", float("-inf")),
+            ("Infinity", float("inf")),
+            ("\u0661\u0662", 12.0),  # Arabic-Indic digits
+            (b"7", 7.0),
+        ]
+        for _ in range(2):  # second pass is served from the cache
+            for input_val, expected in test_cases:
+                with self.subTest(input_val=input_val):
+                    self.assertEqual(get_numeric(input_val), expected)
+
     def test_get_numeric_none_input(self):
         """Test get_numeric with None input."""
         result = get_numeric(None)
@@ -111,6 +129,12 @@ class TestStringUtilities(unittest.TestCase):
         expected = "Item: Widget, Price: $19.99, Quantity: 5"
         self.assertEqual(result, expected)
 
+    def test_safe_format_repeated_template(self):
+        """Test safe_format reuses a template across calls and repeated fields."""
+        template = "{name}-{name}-{n:03d}"
+        self.assertEqual(safe_format(template, {"name": "a", "n": 1}), "a-a-001")
+        self.assertEqual(safe_format(template, {"name": "b", "n": 22, "x": 0}), "b-b-022")
+
     def test_remove_special_chars_basic(self):
         """Test remove_special_chars with basic special characters."""
         # Test with various Unicode categories So, Cn, Co
@@ -163,5 +187,12 @@ class TestStringUtilities(unittest.TestCase):
         self.assertEqual(result, test_text)
 
 
+    def test_remove_special_chars_private_use_and_unassigned(self):
+        """Test that private-use (Co) and unassigned (Cn) code points are removed."""
+        test_text = "a\ue000b\u0378c"
+        self.assertEqual(remove_special_chars(test_text), "abc")
+        # Repeat call exercises the already-populated translate table
+        self.assertEqual(remove_special_chars(test_text), "abc")
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
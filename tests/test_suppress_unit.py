@@ -11,17 +11,38 @@ This module tests all aspects of the suppress functionality including:
 """
 
 import unittest
+import contextlib
+import multiprocessing
 import os
+import signal
+import statistics
 import sys
 import threading
 import time
-import subprocess
 import tempfile
 from io import StringIO
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from unittest.mock import patch, MagicMock
 
+from src.jinnang.io import system
 from src.jinnang.io.system import suppress_c_stdout_stderr
+from tests.helpers import stress_test
+
+
+_LARGE_STDOUT_PAYLOAD = b"".join(f"Large output line {i}\n".encode() for i in range(1000))
+_LARGE_STDERR_PAYLOAD = b"".join(f"Large error line {i}\n".encode() for i in range(1000))
+
+# Worker threads shared by the threaded tests, created once per module
+_executor = None
+
+
+def setUpModule():
+    global _executor
+    _executor = ThreadPoolExecutor(max_workers=10)
+
+
+def tearDownModule():
+    _executor.shutdown()
 
 
 class TestSuppressCStdoutStderr(unittest.TestCase):
@@ -53,16 +74,10 @@ class TestSuppressCStdoutStderr(unittest.TestCase):
                 print("This should appear", file=sys.stdout)
                 print("This error should appear", file=sys.stderr)
         
-        stdout_content = captured_stdout.getvalue()
-        stderr_content = captured_stderr.getvalue()
-        
-        # Python-level output should appear
-        self.assertIn("This should appear", stdout_content)
-        self.assertIn("This error should appear", stderr_content)
-        
-        # C-level output should be suppressed (not in Python stdout/stderr)
-        self.assertNotIn("This should be suppressed", stdout_content)
-        self.assertNotIn("This error should be suppressed", stderr_content)
+        # Python-level output should appear, and nothing else: an exact
+        # line match also rules out leaked C-level output
+        self.assertEqual(captured_stdout.getvalue().splitlines(), ["This should appear"])
+        self.assertEqual(captured_stderr.getvalue().splitlines(), ["This error should appear"])
     
     def test_context_manager_exit(self):
         """Test that suppression is properly restored after context exit."""
@@ -101,17 +116,41 @@ class TestSuppressCStdoutStderr(unittest.TestCase):
                 os.write(1, b"Outer suppressed again\n")
                 print("Outer Python again", file=sys.stdout)
         
-        stdout_content = captured_stdout.getvalue()
+        # Python output should appear in order, with no C-level output
+        self.assertEqual(
+            captured_stdout.getvalue().splitlines(),
+            ["Outer Python", "Inner Python", "Outer Python again"]
+        )
+    
+    def test_nested_suppression_skips_fd_operations(self):
+        """Test that nested contexts reuse the outer redirection without fd syscalls."""
+        with suppress_c_stdout_stderr():
+            with patch('os.dup', side_effect=AssertionError("nested dup")), \
+                    patch('os.dup2', side_effect=AssertionError("nested dup2")):
+                with suppress_c_stdout_stderr(suppress_stderr=True):
+                    os.write(1, b"Inner suppressed\n")
+    
+    def test_suppression_serializes_threads(self):
+        """Test that a second thread waits while another thread is suppressed."""
+        entered = threading.Event()
+        order = []
         
-        # Python output should appear
-        self.assertIn("Outer Python", stdout_content)
-        self.assertIn("Inner Python", stdout_content)
-        self.assertIn("Outer Python again", stdout_content)
+        def other():
+            entered.set()
+            with suppress_c_stdout_stderr():
+                order.append("other")
         
-        # C-level output should be suppressed
-        self.assertNotIn("Outer suppressed", stdout_content)
-        self.assertNotIn("Inner suppressed", stdout_content)
-        self.assertNotIn("Outer suppressed again", stdout_content)
+        with suppress_c_stdout_stderr():
+            thread = threading.Thread(target=other)
+            thread.start()
+            entered.wait()
+            thread.join(timeout=0.05)
+            self.assertTrue(thread.is_alive())
+            order.append("main")
+        thread.join(timeout=5.0)
+        self.assertFalse(thread.is_alive())
+        
+        self.assertEqual(order, ["main", "other"])
     
     def test_exception_handling(self):
         """Test that suppression is properly restored even when exceptions occur."""
@@ -131,73 +170,47 @@ class TestSuppressCStdoutStderr(unittest.TestCase):
             os.close(original_stdout_fd)
             os.close(original_stderr_fd)
     
+    @stress_test
     def test_threading_isolation(self):
         """Test that suppression works correctly across multiple threads."""
-        results = []
-        results_lock = threading.Lock()
-        
         def worker(thread_id, use_suppression):
-            try:
-                if use_suppression:
-                    with suppress_c_stdout_stderr():
-                        # Simulate C-level output (will be suppressed)
-                        os.write(1, f"Thread {thread_id} C output\n".encode())
-                        # This should work fine
-                        result = f"Thread {thread_id} with suppression completed"
-                else:
-                    # Without suppression
+            if use_suppression:
+                with suppress_c_stdout_stderr():
+                    # Simulate C-level output (will be suppressed)
                     os.write(1, f"Thread {thread_id} C output\n".encode())
-                    result = f"Thread {thread_id} without suppression completed"
-                
-                with results_lock:
-                    results.append((thread_id, use_suppression, result))
-                    
-            except Exception as e:
-                with results_lock:
-                    results.append((thread_id, use_suppression, f"Error: {e}"))
-        
-        threads = []
-        for i in range(10):
-            use_suppression = i % 2 == 0  # Alternate between suppressed and non-suppressed
-            thread = threading.Thread(target=worker, args=(i, use_suppression))
-            threads.append(thread)
-            thread.start()
-        
-        for thread in threads:
-            thread.join()
+            else:
+                # Without suppression
+                os.write(1, f"Thread {thread_id} C output\n".encode())
+            return thread_id, use_suppression
         
-        # Verify results
-        self.assertEqual(len(results), 10)
+        # Alternate between suppressed and non-suppressed; map re-raises any
+        # worker exception and preserves submission order
+        thread_ids = range(10)
+        modes = [i % 2 == 0 for i in thread_ids]
+        results = list(_executor.map(worker, thread_ids, modes))
         
-        for thread_id, used_suppression, result in results:
-            # All threads should complete successfully
-            self.assertIn("completed", result)
-            self.assertNotIn("Error:", result)
-            
-            # Verify the correct suppression mode was used
-            if used_suppression:
-                self.assertIn("with suppression", result)
-            else:
-                self.assertIn("without suppression", result)
+        self.assertListEqual(results, list(zip(thread_ids, modes)))
     
+    @stress_test
     def test_concurrent_suppression(self):
         """Test concurrent suppression operations."""
+        # Release all workers at once so they contend for the context
+        barrier = threading.Barrier(5)
+        
         def worker(worker_id):
+            barrier.wait()
             with suppress_c_stdout_stderr():
                 # Simulate some work with C-level output
                 for i in range(10):
                     os.write(1, f"Worker {worker_id} iteration {i}\n".encode())
-                    time.sleep(0.001)  # Small delay to increase chance of interleaving
-                return f"Worker {worker_id} completed"
+                return worker_id
         
         with ThreadPoolExecutor(max_workers=5) as executor:
             futures = [executor.submit(worker, i) for i in range(5)]
             results = [future.result() for future in as_completed(futures)]
         
-        # All workers should complete successfully
-        self.assertEqual(len(results), 5)
-        for i in range(5):
-            self.assertIn(f"Worker {i} completed", results)
+        # All workers should complete successfully, each exactly once
+        self.assertCountEqual(results, range(5))
     
     def test_mixed_suppression_and_normal_output(self):
         """Test mixing suppressed and normal output in the same thread."""
@@ -214,130 +227,226 @@ class TestSuppressCStdoutStderr(unittest.TestCase):
             # Normal output again
             print("After suppression", file=sys.stdout)
         
-        stdout_content = captured_stdout.getvalue()
-        
-        # Python output should appear
-        self.assertIn("Before suppression", stdout_content)
-        self.assertIn("During suppression", stdout_content)
-        self.assertIn("After suppression", stdout_content)
-        
-        # C output should be suppressed
-        self.assertNotIn("Suppressed C output", stdout_content)
+        # Python output should appear in order, with no C-level output
+        self.assertEqual(
+            captured_stdout.getvalue().splitlines(),
+            ["Before suppression", "During suppression", "After suppression"]
+        )
     
     def test_large_output_suppression(self):
         """Test suppression of large amounts of output."""
         with suppress_c_stdout_stderr():
-            # Generate large amount of C-level output
-            for i in range(1000):
-                os.write(1, f"Large output line {i}\n".encode())
-                os.write(2, f"Large error line {i}\n".encode())
+            # Generate large amount of C-level output in one write per stream
+            os.write(1, _LARGE_STDOUT_PAYLOAD)
+            os.write(2, _LARGE_STDERR_PAYLOAD)
         
         # Should complete without issues
         # The main test is that this doesn't hang or crash
     
+    def test_suppressed_writes_are_fully_accepted(self):
+        """Test that the sink swallows writes of any size without short writes."""
+        payload = b"x" * (256 * 1024)  # well beyond a pipe buffer
+        with suppress_c_stdout_stderr(suppress_stderr=True):
+            for fd in (1, 2, 1):
+                self.assertEqual(os.write(fd, payload), len(payload))
+    
     def test_rapid_context_switching(self):
         """Test rapid entering and exiting of suppression contexts."""
-        for i in range(100):
+        # A few cycles are enough to catch state leaking from one exit into
+        # the next entry; throughput is covered by the overhead test.
+        original = os.fstat(1)
+        for i in range(3):
             with suppress_c_stdout_stderr():
                 os.write(1, f"Rapid test {i}\n".encode())
+            restored = os.fstat(1)
+            self.assertEqual(
+                (restored.st_dev, restored.st_ino), (original.st_dev, original.st_ino)
+            )
+    
+    def test_devnull_fd_shared_across_calls(self):
+        """Test that /dev/null is opened once and reused by later contexts."""
+        with suppress_c_stdout_stderr():
+            pass
+        devnull_fd = system._devnull_fd
+        self.assertIsNotNone(devnull_fd)
         
-        # Should complete without issues
+        with patch('os.open', side_effect=AssertionError("/dev/null reopened")):
+            with suppress_c_stdout_stderr(suppress_stderr=True):
+                os.write(1, b"Shared devnull test\n")
+        
+        self.assertEqual(system._devnull_fd, devnull_fd)
     
-    def test_subprocess_integration(self):
-        """Test that suppression works with subprocess calls."""
-        # Create a temporary script that produces C-level output
-        script_content = f'''
-import os
-import sys
-sys.path.insert(0, "{os.path.abspath('src')}")
-from jinnang.io.system import suppress_c_stdout_stderr
+    def test_devnull_fd_reopened_after_reuse(self):
+        """Test that a closed and reused /dev/null fd is replaced, not written through."""
+        with suppress_c_stdout_stderr():
+            pass
+        stale_fd = system._devnull_fd
+        os.close(stale_fd)
+        # The lowest free number is taken by an unrelated file
+        with tempfile.TemporaryFile() as unrelated:
+            with suppress_c_stdout_stderr():
+                os.write(1, b"Must not reach the reused fd\n")
+            unrelated.seek(0)
+            self.assertEqual(unrelated.read(), b"")
+        
+        st = os.fstat(system._devnull_fd)
+        self.assertEqual((st.st_dev, st.st_ino), system._devnull_id)
 
-# Test without suppression first
-print("Before suppression")
 
-with suppress_c_stdout_stderr():
-    # These writes should be suppressed at C level
-    os.write(1, b"C stdout from subprocess\\n")
-    os.write(2, b"C stderr from subprocess\\n")
-    # Python level output should still work
-    print("Python stdout from subprocess")
-    print("Python stderr from subprocess", file=sys.stderr)
+def _run_devnull_closed_child(stdout_fd, unrelated_path):
+    """Child-process body: lose the inherited /dev/null fd to an unrelated file, then suppress."""
+    os.dup2(stdout_fd, 1)
+    # suppress_c_stdout_stderr redirects sys.stdout.fileno()
+    sys.stdout = open(1, 'w', closefd=False)
+    # Inherited from the parent (or opened here), then closed the way a
+    # daemonizing library's closerange would close it
+    with suppress_c_stdout_stderr():
+        pass
+    os.close(system._devnull_fd)
+    unrelated_fd = os.open(unrelated_path, os.O_WRONLY | os.O_CREAT, 0o600)
+    try:
+        with suppress_c_stdout_stderr():
+            os.write(1, b"C stdout after closerange\n")
+    finally:
+        os.close(unrelated_fd)
 
-print("After suppression")
-'''
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
-            f.write(script_content)
-            script_path = f.name
-        
-        try:
-            # Run the script
-            result = subprocess.run(
-                [sys.executable, script_path],
-                capture_output=True,
-                text=True
+
+def _run_suppressed_child(stdout_fd, stderr_fd):
+    """Child-process body: point fds 1/2 at the given files, then suppress."""
+    os.dup2(stdout_fd, 1)
+    os.dup2(stderr_fd, 2)
+    # Explicitly buffered streams, independent of PYTHONUNBUFFERED
+    sys.stdout = open(1, 'w', closefd=False)
+    sys.stderr = open(2, 'w', closefd=False)
+    
+    print("Before suppression")
+    with suppress_c_stdout_stderr(suppress_stderr=True):
+        # These writes should be suppressed at C level
+        os.write(1, b"C stdout from child\n")
+        os.write(2, b"C stderr from child\n")
+        # Python level output should still work
+        print("Python stdout from child")
+        print("Python stderr from child", file=sys.stderr)
+    print("After suppression")
+    
+    sys.stdout.flush()
+    sys.stderr.flush()
+
+
+@unittest.skipUnless(
+    "fork" in multiprocessing.get_all_start_methods(),
+    "requires the fork start method"
+)
+class TestSuppressSubprocess(unittest.TestCase):
+    """Test suppression inside a forked child process, run once per class."""
+    
+    @classmethod
+    def setUpClass(cls):
+        # fork inherits the imported modules, so no interpreter start-up cost
+        ctx = multiprocessing.get_context("fork")
+        with tempfile.TemporaryFile() as out, tempfile.TemporaryFile() as err:
+            child = ctx.Process(
+                target=_run_suppressed_child, args=(out.fileno(), err.fileno())
             )
-            
-            # Should complete successfully
-            self.assertEqual(result.returncode, 0)
-            
-            # Python output should appear
-            self.assertIn("Before suppression", result.stdout)
-            self.assertIn("Python stdout from subprocess", result.stdout)
-            self.assertIn("After suppression", result.stdout)
-            self.assertIn("Python stderr from subprocess", result.stderr)
-            
-            # Note: C-level suppression in subprocess is complex to test
-            # The main goal is to ensure the function doesn't crash
-            
-        finally:
-            os.unlink(script_path)
+            child.start()
+            child.join()
+            cls.exitcode = child.exitcode
+            out.seek(0)
+            err.seek(0)
+            # Raw bytes; the assertions compare bytes, so nothing is decoded
+            cls.stdout = out.read()
+            cls.stderr = err.read()
+    
+    def test_subprocess_exits_cleanly(self):
+        """Test that the suppressing child process completes successfully."""
+        self.assertEqual(self.exitcode, 0)
+    
+    def test_subprocess_python_stdout(self):
+        """Test that Python-level stdout from the child survives suppression."""
+        self.assertIn(b"Before suppression", self.stdout)
+        self.assertIn(b"Python stdout from child", self.stdout)
+        self.assertIn(b"After suppression", self.stdout)
+    
+    def test_subprocess_python_stderr(self):
+        """Test that Python-level stderr from the child is not suppressed."""
+        self.assertIn(b"Python stderr from child", self.stderr)
+    
+    def test_subprocess_c_output_suppressed(self):
+        """Test that C-level writes in the child never reach its fds 1/2."""
+        self.assertNotIn(b"C stdout from child", self.stdout)
+        self.assertNotIn(b"C stderr from child", self.stderr)
 
 
+@unittest.skipUnless(
+    "fork" in multiprocessing.get_all_start_methods(),
+    "requires the fork start method"
+)
+class TestSuppressDevnullAfterFork(unittest.TestCase):
+    """Test that a forked child whose /dev/null fd was closed still suppresses safely."""
+    
+    def test_child_reopens_closed_devnull_fd(self):
+        # Make sure the parent has a cached fd for the child to inherit
+        with suppress_c_stdout_stderr():
+            pass
+        ctx = multiprocessing.get_context("fork")
+        with tempfile.TemporaryDirectory() as tmp, tempfile.TemporaryFile() as out:
+            unrelated_path = os.path.join(tmp, "unrelated.bin")
+            child = ctx.Process(
+                target=_run_devnull_closed_child, args=(out.fileno(), unrelated_path)
+            )
+            child.start()
+            child.join()
+            self.assertEqual(child.exitcode, 0)
+            with open(unrelated_path, 'rb') as f:
+                self.assertEqual(f.read(), b"")
+            out.seek(0)
+            self.assertEqual(out.read(), b"")
+        # The parent's descriptor is untouched by the child's close
+        st = os.fstat(system._devnull_fd)
+        self.assertEqual((st.st_dev, st.st_ino), system._devnull_id)
+
+
+@stress_test
 class TestSuppressPerformance(unittest.TestCase):
     """Test performance characteristics of suppression."""
     
     def test_suppression_overhead(self):
         """Test that suppression doesn't add excessive overhead."""
-        # Test without suppression
-        iterations = 100  # Reduced for more realistic testing
-        start_time = time.time()
-        for i in range(iterations):
-            # Do some minimal work
-            _ = i * 2
-        no_suppression_time = time.time() - start_time
-        
-        # Test with suppression
-        start_time = time.time()
-        for i in range(iterations):
-            with suppress_c_stdout_stderr():
-                # Do the same minimal work
-                _ = i * 2
-        suppression_time = time.time() - start_time
-        
-        # Suppression will add overhead, but shouldn't be excessive
-        # Allow for reasonable overhead (100x is generous for file descriptor operations)
-        max_allowed_time = max(no_suppression_time * 100, 1.0)  # At least 1 second allowance
-        self.assertLess(suppression_time, max_allowed_time, 
-                       f"Suppression took {suppression_time:.3f}s vs {no_suppression_time:.3f}s baseline")
+        # Median of several trials with a ns-resolution clock, so a single
+        # GC pause or scheduler blip cannot decide the outcome (pyperf-style).
+        trials, iterations = 7, 1000
+        
+        def median_ns(make_context):
+            samples = []
+            for _ in range(trials):
+                start = time.perf_counter_ns()
+                for i in range(iterations):
+                    with make_context():
+                        _ = i * 2
+                samples.append(time.perf_counter_ns() - start)
+            return statistics.median(samples)
+        
+        baseline_ns = median_ns(contextlib.nullcontext)
+        suppression_ns = median_ns(suppress_c_stdout_stderr)
+        
+        # A few fd syscalls per entry; a do-nothing context manager is the baseline
+        ratio = suppression_ns / baseline_ns
+        self.assertLess(
+            ratio, 500,
+            f"Suppression median {suppression_ns / iterations:.0f}ns/entry vs "
+            f"{baseline_ns / iterations:.0f}ns/entry baseline ({ratio:.0f}x)"
+        )
     
     def test_concurrent_performance(self):
         """Test performance under concurrent access."""
-        def worker():
+        def worker(_):
             for i in range(100):
                 with suppress_c_stdout_stderr():
                     os.write(1, f"Worker output {i}\n".encode())
         
         start_time = time.time()
         
-        threads = []
-        for _ in range(10):
-            thread = threading.Thread(target=worker)
-            threads.append(thread)
-            thread.start()
-        
-        for thread in threads:
-            thread.join()
+        list(_executor.map(worker, range(10)))
         
         duration = time.time() - start_time
         
@@ -348,6 +457,18 @@ class TestSuppressPerformance(unittest.TestCase):
 class TestSuppressEdgeCases(unittest.TestCase):
     """Test edge cases and error conditions."""
     
+    @classmethod
+    def setUpClass(cls):
+        # Install the SIGUSR1 handler once for the class, restored afterwards
+        cls.received_signals = []
+        cls.original_sigusr1 = signal.signal(
+            signal.SIGUSR1, lambda signum, frame: cls.received_signals.append(signum)
+        )
+    
+    @classmethod
+    def tearDownClass(cls):
+        signal.signal(signal.SIGUSR1, cls.original_sigusr1)
+    
     def test_already_redirected_descriptors(self):
         """Test behavior when descriptors are already redirected."""
         # This is a complex test that would require mocking file descriptor operations
@@ -366,21 +487,13 @@ class TestSuppressEdgeCases(unittest.TestCase):
     def test_signal_handling(self):
         """Test that suppression works correctly with signal handling."""
         # Basic test to ensure signals don't interfere
-        import signal
-        
-        def signal_handler(signum, frame):
-            pass
-        
-        original_handler = signal.signal(signal.SIGUSR1, signal_handler)
+        with suppress_c_stdout_stderr():
+            os.write(1, b"Signal test\n")
+            # Send signal to self (this is safe in tests)
+            os.kill(os.getpid(), signal.SIGUSR1)
+            os.write(1, b"After signal\n")
         
-        try:
-            with suppress_c_stdout_stderr():
-                os.write(1, b"Signal test\n")
-                # Send signal to self (this is safe in tests)
-                os.kill(os.getpid(), signal.SIGUSR1)
-                os.write(1, b"After signal\n")
-        finally:
-            signal.signal(signal.SIGUSR1, original_handler)
+        self.assertIn(signal.SIGUSR1, self.received_signals)
 
 
 class TestSuppressIntegration(unittest.TestCase):
@@ -396,21 +509,12 @@ class TestSuppressIntegration(unittest.TestCase):
             with global_lock("suppress_integration_test"):
                 with suppress_c_stdout_stderr():
                     os.write(1, f"Worker {worker_id} C output\n".encode())
-                    results.append(f"Worker {worker_id} completed")
+                    results.append(worker_id)
         
-        threads = []
-        for i in range(5):
-            thread = threading.Thread(target=worker, args=(i,))
-            threads.append(thread)
-            thread.start()
+        list(_executor.map(worker, range(5)))
         
-        for thread in threads:
-            thread.join()
-        
-        # All workers should complete
-        self.assertEqual(len(results), 5)
-        for i in range(5):
-            self.assertIn(f"Worker {i} completed", results)
+        # All workers should complete, each exactly once
+        self.assertCountEqual(results, range(5))
     
     def test_real_world_scenario(self):
         """Test a real-world scenario with mixed operations."""
@@ -423,9 +527,6 @@ class TestSuppressIntegration(unittest.TestCase):
                 os.write(1, f"Processing data {data_id}...\n".encode())
                 os.write(2, f"Debug info for data {data_id}\n".encode())
                 
-                # Simulate actual work
-                time.sleep(0.01)
-                
                 # Return result (this would normally go to Python stdout)
                 return {"data_id": data_id, "status": "processed"}
         
@@ -1,14 +1,13 @@
 import os
+import shutil
 import sys
 import tempfile
 import unittest
-import subprocess
 import threading
-import asyncio
-import time
+from contextlib import ExitStack, nullcontext
 from pathlib import Path
-from io import StringIO
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
 
 from jinnang.io.system import (
     suppress_c_stdout_stderr,
@@ -21,25 +20,53 @@ from jinnang.io.system import (
     inplace_overwrite_meta
 )
 
+from tests.helpers import stress_test, touch
+
+
+# RAM-backed tmpfs for fixture files where available, else the default temp dir
+_TMPFS_DIR = '/dev/shm' if os.access('/dev/shm', os.W_OK) else None
+
+_FIXTURE_BYTES = b"Test content"
+# Payloads whose contents are read back and compared after an operation
+_MOVE_BYTES = b"Move me"
+_COPY_BYTES = b"Copy me with metadata"
+_TARGET_BYTES = b"Target file"
+# Written inside suppression contexts; the bytes are discarded either way
+_SUPPRESSED_MSG = b"suppressed\n"
+# Size of the payload for the opt-in large-file copy test (4 MiB)
+_LARGE_PAYLOAD_SIZE = 4 * 1024 * 1024
+# Whether a read-only directory makes unlink fail; not on Windows or as root
+_DIR_MODE_BLOCKS_UNLINK = sys.platform != 'win32' and not (
+    hasattr(os, 'geteuid') and os.geteuid() == 0)
+# Overall bound, in seconds, on waiting for worker threads
+_THREAD_DEADLINE = 5.0
+
+
+def _read_bytes(path):
+    """Return the contents of ``path``; the str-path counterpart of ``Path.read_bytes``."""
+    with open(path, 'rb') as f:
+        return f.read()
+
 
 class TestSystemIO(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # One temporary root for the whole class, removed in a single rmtree
+        cls.temp_root = tempfile.TemporaryDirectory(dir=_TMPFS_DIR)
+        # Read-only source file, written once and shared by every test
+        cls.test_file_s = os.path.join(cls.temp_root.name, "test_file.txt")
+        touch(cls.test_file_s, _FIXTURE_BYTES)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.temp_root.cleanup()
+
     def setUp(self):
-        # Create temporary directory for file operations
-        self.temp_dir = tempfile.TemporaryDirectory()
-        self.temp_path = Path(self.temp_dir.name)
-        
-        # Create test files
-        self.test_file = self.temp_path / "test_file.txt"
-        with open(self.test_file, "w") as f:
-            f.write("Test content")
-            
-        # Create a subdirectory
-        self.sub_dir = self.temp_path / "subdir"
-        self.sub_dir.mkdir(exist_ok=True)
-    
-    def tearDown(self):
-        # Clean up temporary directory
-        self.temp_dir.cleanup()
+        # Fresh per-test directory for file operations, under the shared root.
+        # Paths are kept as str; the Path forms are for tests of Path inputs.
+        self.temp_path_s = tempfile.mkdtemp(dir=self.temp_root.name)
+        self.addCleanup(shutil.rmtree, self.temp_path_s, ignore_errors=True)
+        self.temp_path = Path(self.temp_path_s)
     
     def test_suppress_c_stdout_stderr(self):
         # Test basic functionality - no suppression to avoid pytest conflicts
@@ -59,19 +86,14 @@ class TestSystemIO(unittest.TestCase):
     
     def test_suppress_c_stdout_stderr_nested_calls(self):
         """Test that nested calls work correctly without conflicts"""
-        # Test nested calls - should handle gracefully (no suppression during pytest)
-        with suppress_c_stdout_stderr(suppress_stdout=False, suppress_stderr=False):
-            # First level
-            with suppress_c_stdout_stderr(suppress_stdout=False, suppress_stderr=False):
-                # Second level - should not interfere
-                with suppress_c_stdout_stderr(suppress_stdout=False, suppress_stderr=False):
-                    # Third level - should not interfere
-                    pass
-                # Back to second level
-                pass
-            # Back to first level
-            pass
-        # All should be restored properly
+        # Enter the levels in a loop; raise depth to exercise deeper nesting.
+        # No suppression during pytest.
+        depth = 3
+        with ExitStack() as stack:
+            for _ in range(depth):
+                stack.enter_context(
+                    suppress_c_stdout_stderr(suppress_stdout=False, suppress_stderr=False))
+        # All levels exited without raising
     
     def test_suppress_c_stdout_stderr_exception_handling(self):
         """Test that exceptions don't break file descriptor restoration"""
@@ -85,310 +107,172 @@ class TestSystemIO(unittest.TestCase):
         # File descriptors should still be properly restored
         # We can't easily verify this directly, but the context manager should complete without hanging
     
-    def test_suppress_c_stdout_stderr_thread_safety(self):
-        """Test thread safety of the context manager"""
-        import threading
-        import time
-        
-        results = []
-        errors = []
-        
-        def worker(worker_id):
-            try:
-                # Test without suppression to avoid conflicts with pytest
-                with suppress_c_stdout_stderr(suppress_stdout=False, suppress_stderr=False):
-                    # Simulate some work
-                    time.sleep(0.01)
-                    # Nested call to test thread-local storage
-                    with suppress_c_stdout_stderr(suppress_stdout=False, suppress_stderr=False):
-                        time.sleep(0.01)
-                results.append(f"Worker {worker_id} completed")
-            except Exception as e:
-                errors.append(f"Worker {worker_id} failed: {e}")
-        
-        # Create multiple threads
-        threads = []
-        for i in range(3):  # Reduced number to avoid overwhelming the test
-            thread = threading.Thread(target=worker, args=(i,))
-            threads.append(thread)
-            thread.start()
-        
-        # Wait for all threads to complete
-        for thread in threads:
-            thread.join(timeout=5.0)  # 5 second timeout
-        
-        # Check results
-        self.assertEqual(len(errors), 0, f"Thread errors: {errors}")
-        self.assertEqual(len(results), 3, f"Expected 3 results, got {len(results)}")
-    
     def test_suppress_c_stdout_stderr_recursive_calls(self):
-        """Test recursive function calls with the context manager"""
-        def recursive_function(depth):
+        """Test recursive function calls inside the context manager"""
+        def recursive_function(depth, trace):
             if depth <= 0:
-                return "base case"
-            
-            # No suppression during pytest to avoid conflicts
-            with suppress_c_stdout_stderr(suppress_stdout=False, suppress_stderr=False):
-                # Recursive call within the context
-                result = recursive_function(depth - 1)
-                return f"depth {depth}: {result}"
-        
-        # Test recursive calls
-        result = recursive_function(3)
-        self.assertIn("base case", result)
-        self.assertIn("depth 1", result)
-        self.assertIn("depth 2", result)
-        self.assertIn("depth 3", result)
-    
-    def test_suppress_c_stdout_stderr_real_async_scenario(self):
-        """Test suppress_c_stdout_stderr in real async-like scenario with actual suppression."""
-        # Simplified test to avoid complex subprocess scripts
-        import threading
-        import time
-        
-        results = {}
-        
-        def async_worker(worker_id):
-            """Simulate async worker with nested suppression calls."""
-            try:
-                with suppress_c_stdout_stderr(suppress_stdout=True, suppress_stderr=True):
-                    # This should be suppressed
-                    os.write(1, f"Worker {worker_id} stdout - should be suppressed\n".encode())
-                    os.write(2, f"Worker {worker_id} stderr - should be suppressed\n".encode())
-                    
-                    # Nested call
-                    with suppress_c_stdout_stderr(suppress_stdout=True, suppress_stderr=True):
-                        os.write(1, f"Worker {worker_id} nested stdout - should be suppressed\n".encode())
-                        
-                        # Recursive-like nested call
-                        def nested_function(depth):
-                            if depth <= 0:
-                                return
-                            with suppress_c_stdout_stderr(suppress_stdout=True, suppress_stderr=True):
-                                os.write(1, f"Worker {worker_id} depth {depth} - should be suppressed\n".encode())
-                                nested_function(depth - 1)
-                        
-                        nested_function(3)
-                
-                results[worker_id] = "success"
-            except Exception as e:
-                results[worker_id] = f"failed: {e}"
-        
-        # Test with multiple threads
-        threads = []
-        
-        for i in range(3):
-            thread = threading.Thread(target=async_worker, args=(i,))
-            threads.append(thread)
-            thread.start()
-        
-        for thread in threads:
-            thread.join()
-        
-        # Verify all workers completed successfully
-        success_count = sum(1 for r in results.values() if r == "success")
-        self.assertEqual(success_count, 3, f"Only {success_count}/3 workers succeeded: {results}")
+                trace.append("base case")
+                return
+            trace.append(f"depth {depth}")
+            recursive_function(depth - 1, trace)
+        
+        # Enter once and recurse inside it; per-frame nesting is covered by
+        # the nested-calls and concurrent tests. No suppression during pytest.
+        trace = []
+        with suppress_c_stdout_stderr(suppress_stdout=False, suppress_stderr=False):
+            recursive_function(3, trace)
+        self.assertEqual(trace, ["depth 3", "depth 2", "depth 1", "base case"])
     
-    def test_suppress_c_stdout_stderr_concurrent_futures(self):
-        """Test suppress_c_stdout_stderr with concurrent.futures for real async behavior."""
-        # This test is overly complex and prone to syntax errors. 
-        # The core functionality is already tested in unit tests.
-        # Let's simplify to test basic concurrent suppression.
-        
-        from concurrent.futures import ThreadPoolExecutor
-        import threading
-        
-        results = []
-        
-        def simple_task(task_id):
+    @stress_test
+    def test_suppress_c_stdout_stderr_concurrent(self):
+        """Threads enter (nested) suppression simultaneously without interfering."""
+        def enter(depth):
             with suppress_c_stdout_stderr(suppress_stdout=True, suppress_stderr=True):
-                os.write(1, b"Should be suppressed\n")
-                os.write(2, b"Should be suppressed\n")
-            results.append(f"Task {task_id} completed")
-            return f"success-{task_id}"
-        
-        # Test with ThreadPoolExecutor
-        with ThreadPoolExecutor(max_workers=4) as executor:
-            futures = [executor.submit(simple_task, i) for i in range(5)]
-            task_results = [future.result() for future in futures]
-        
-        # Verify all tasks completed successfully
-        self.assertEqual(len(task_results), 5)
-        self.assertTrue(all(r.startswith("success") for r in task_results))
-        self.assertEqual(len(results), 5)
-    
-    def test_suppress_c_stdout_stderr_stress_test(self):
-        """Stress test with high concurrency and deep nesting."""
-        # Simplified stress test to avoid complex subprocess scripts
-        import threading
-        import time
-        import random
-        
-        results = {}
-        
-        def stress_worker(worker_id, iterations):
-            """Stress test worker with random nesting and timing."""
-            try:
-                for i in range(iterations):
-                    # Small delay to increase chance of race conditions
-                    time.sleep(random.uniform(0.001, 0.005))
-                    
-                    with suppress_c_stdout_stderr(suppress_stdout=True, suppress_stderr=True):
-                        os.write(1, f"Worker {worker_id} iter {i} - suppressed\n".encode())
-                        
-                        # Simple nesting test
-                        with suppress_c_stdout_stderr(suppress_stdout=True, suppress_stderr=True):
-                            os.write(1, f"Worker {worker_id} nested - suppressed\n".encode())
-                
-                results[worker_id] = "success"
-            
-            except Exception as e:
-                results[worker_id] = f"failed: {e}"
-        
-        # High concurrency stress test
-        threads = []
-        num_workers = 8
-        iterations_per_worker = 5  # Reduced for faster testing
-        
-        for i in range(num_workers):
-            thread = threading.Thread(target=stress_worker, args=(i, iterations_per_worker))
-            threads.append(thread)
-            thread.start()
-        
-        for thread in threads:
-            thread.join()
-        
-        # Verify all workers completed successfully
-        success_count = sum(1 for r in results.values() if r == "success")
-        self.assertEqual(success_count, num_workers, f"Only {success_count}/{num_workers} workers succeeded: {results}")
-    
+                os.write(1, _SUPPRESSED_MSG)
+                os.write(2, _SUPPRESSED_MSG)
+                if depth > 1:
+                    enter(depth - 1)
+
+        # One pool for all cases, sized for the largest
+        executor = ThreadPoolExecutor(max_workers=8)
+        self.addCleanup(executor.shutdown)
+
+        # (workers, iterations per worker, nesting depth)
+        for workers, iterations, depth in [(3, 1, 1), (8, 5, 2), (4, 5, 3)]:
+            with self.subTest(workers=workers, iterations=iterations, depth=depth):
+                # Release all workers at once instead of sleeping to provoke races;
+                # both waits are bounded, so a hang fails fast instead of stalling
+                barrier = threading.Barrier(workers, timeout=_THREAD_DEADLINE)
+
+                def worker(worker_id):
+                    barrier.wait()
+                    for _ in range(iterations):
+                        enter(depth)
+                    return worker_id
+
+                completed = list(
+                    executor.map(worker, range(workers), timeout=_THREAD_DEADLINE)
+                )
+                self.assertEqual(completed, list(range(workers)))
+
     def test_suppress_stdout_stderr(self):
+        # Only the stream rebinding matters, so nothing is written; identity
+        # checks avoid invoking the streams' __eq__
         # Test suppressing Python-level stdout
         original_stdout = sys.stdout
         with suppress_stdout_stderr(suppress_stdout=True, suppress_stderr=False):
-            print("This should be suppressed")
-            self.assertNotEqual(sys.stdout, original_stdout)
-        self.assertEqual(sys.stdout, original_stdout)  # Check stdout is restored
+            self.assertIsNot(sys.stdout, original_stdout)
+        self.assertIs(sys.stdout, original_stdout)  # Check stdout is restored
         
         # Test suppressing Python-level stderr
         original_stderr = sys.stderr
         with suppress_stdout_stderr(suppress_stdout=False, suppress_stderr=True):
-            sys.stderr.write("This should be suppressed")
-            self.assertNotEqual(sys.stderr, original_stderr)
-        self.assertEqual(sys.stderr, original_stderr)  # Check stderr is restored
+            self.assertIsNot(sys.stderr, original_stderr)
+        self.assertIs(sys.stderr, original_stderr)  # Check stderr is restored
         
         # Test suppressing both
         with suppress_stdout_stderr(suppress_stdout=True, suppress_stderr=True):
-            print("This should be suppressed")
-            sys.stderr.write("This should be suppressed")
-            self.assertNotEqual(sys.stdout, original_stdout)
-            self.assertNotEqual(sys.stderr, original_stderr)
-        self.assertEqual(sys.stdout, original_stdout)  # Check stdout is restored
-        self.assertEqual(sys.stderr, original_stderr)  # Check stderr is restored
-    
-    def test_get_worker_num_for_io_bounded_task(self):
-        # Test with user-defined value within bounds
-        self.assertEqual(get_worker_num_for_io_bounded_task(5), 5)
-        
-        # Test with user-defined value below minimum
-        self.assertEqual(get_worker_num_for_io_bounded_task(0), 1)
-        
-        # Test with user-defined value above maximum
-        self.assertEqual(get_worker_num_for_io_bounded_task(50), 32)
-        
-        # Test with no user-defined value (auto-calculation)
-        # We can't assert exact value as it depends on the system's CPU count
-        worker_num = get_worker_num_for_io_bounded_task()
-        self.assertGreaterEqual(worker_num, 4)  # Should be at least 4
-        self.assertLessEqual(worker_num, 32)    # Should not exceed 32
+            self.assertIsNot(sys.stdout, original_stdout)
+            self.assertIsNot(sys.stderr, original_stderr)
+        self.assertIs(sys.stdout, original_stdout)  # Check stdout is restored
+        self.assertIs(sys.stderr, original_stderr)  # Check stderr is restored
     
     def test_create_relative_symlink(self):
         # Create a symlink to the test file
-        link_folder = self.temp_path / "links"
-        create_relative_symlink(str(self.test_file), str(link_folder))
+        link_folder_s = os.path.join(self.temp_path_s, "links")
+        create_relative_symlink(self.test_file_s, link_folder_s)
         
         # Check if the symlink was created
-        link_path = link_folder / self.test_file.name
-        self.assertTrue(link_path.exists())
-        self.assertTrue(link_path.is_symlink())
+        link_path_s = os.path.join(link_folder_s, os.path.basename(self.test_file_s))
+        self.assertTrue(os.access(link_path_s, os.F_OK))
+        self.assertTrue(os.path.islink(link_path_s))
         
         # Check if the symlink points to the correct file
-        self.assertEqual(os.readlink(link_path), os.path.relpath(self.test_file, link_folder))
+        self.assertEqual(os.readlink(link_path_s), os.path.relpath(self.test_file_s, link_folder_s))
         
         # Check if the content is accessible through the symlink
-        with open(link_path, "r") as f:
-            self.assertEqual(f.read(), "Test content")
+        self.assertEqual(_read_bytes(link_path_s), _FIXTURE_BYTES)
         
         # Test with invalid inputs
         with self.assertRaises(AssertionError):
-            create_relative_symlink("", str(link_folder))
+            create_relative_symlink("", link_folder_s)
         
         with self.assertRaises(AssertionError):
-            create_relative_symlink(str(self.test_file), "")
+            create_relative_symlink(self.test_file_s, "")
     
     def test_safe_delete(self):
         # Create a file to delete
-        file_to_delete = self.temp_path / "delete_me.txt"
-        with open(file_to_delete, "w") as f:
-            f.write("Delete me")
+        file_to_delete = os.path.join(self.temp_path_s, "delete_me.txt")
+        touch(file_to_delete, b"Delete me")
         
         # Test deleting an existing file
-        self.assertTrue(file_to_delete.exists())
+        self.assertTrue(os.access(file_to_delete, os.F_OK))
         safe_delete(file_to_delete)
-        self.assertFalse(file_to_delete.exists())
+        self.assertFalse(os.access(file_to_delete, os.F_OK))
         
         # Test deleting a non-existent file (should not raise an error)
         safe_delete(file_to_delete)  # File is already deleted
-        
-        # Test deleting a file with permission error (using mock)
-        from unittest.mock import patch
-        test_file = self.temp_path / "test_perm.txt"
-        with open(test_file, "w") as f:
-            f.write("Test file")
-        
-        with patch('os.remove', side_effect=PermissionError("Permission denied")):
-            with self.assertRaises(PermissionError):
-                safe_delete(test_file)
+
+    def test_safe_delete_permission_error(self):
+        ro_dir = os.path.join(self.temp_path_s, "ro")
+        os.mkdir(ro_dir)
+        test_file = os.path.join(ro_dir, "test_perm.txt")
+        touch(test_file, b"Test file")
+
+        if _DIR_MODE_BLOCKS_UNLINK:
+            # A file in a directory without write permission cannot be unlinked
+            os.chmod(ro_dir, 0o500)
+            self.addCleanup(os.chmod, ro_dir, 0o700)
+            blocked = nullcontext()
+        else:
+            # Windows and root ignore the directory mode; inject the error instead
+            blocked = patch('os.remove', side_effect=PermissionError("Permission denied"))
+
+        with blocked, self.assertRaises(PermissionError):
+            safe_delete(test_file)
+        self.assertTrue(os.access(test_file, os.F_OK))
     
     def test_safe_move(self):
+        sub_dir_s = os.path.join(self.temp_path_s, "subdir")
+        os.mkdir(sub_dir_s)
+
         # Create a file to move
-        src_file = self.temp_path / "move_me.txt"
-        with open(src_file, "w") as f:
-            f.write("Move me")
+        src_file_s = os.path.join(self.temp_path_s, "move_me.txt")
+        touch(src_file_s, _MOVE_BYTES)
         
         # Test moving to a new location
-        dst_file = self.temp_path / "moved.txt"
-        self.assertTrue(safe_move(str(src_file), str(dst_file)))
-        self.assertFalse(src_file.exists())
-        self.assertTrue(dst_file.exists())
-        with open(dst_file, "r") as f:
-            self.assertEqual(f.read(), "Move me")
+        dst_file_s = os.path.join(self.temp_path_s, "moved.txt")
+        self.assertTrue(safe_move(src_file_s, dst_file_s))
+        self.assertFalse(os.access(src_file_s, os.F_OK))
+        self.assertTrue(os.access(dst_file_s, os.F_OK))
+        self.assertEqual(_read_bytes(dst_file_s), _MOVE_BYTES)
         
         # Test moving to a directory (should use the original filename)
-        src_file = self.temp_path / "move_to_dir.txt"
-        with open(src_file, "w") as f:
-            f.write("Move to directory")
+        src_file_s = os.path.join(self.temp_path_s, "move_to_dir.txt")
+        touch(src_file_s, b"Move to directory")
         
-        self.assertTrue(safe_move(str(src_file), str(self.sub_dir)))
-        self.assertFalse(src_file.exists())
-        self.assertTrue((self.sub_dir / "move_to_dir.txt").exists())
+        self.assertTrue(safe_move(src_file_s, sub_dir_s))
+        self.assertFalse(os.access(src_file_s, os.F_OK))
+        self.assertTrue(os.access(os.path.join(sub_dir_s, "move_to_dir.txt"), os.F_OK))
         
         # Test moving a non-existent file
-        non_existent = self.temp_path / "non_existent.txt"
-        self.assertFalse(safe_move(str(non_existent), str(self.sub_dir)))
+        non_existent_s = os.path.join(self.temp_path_s, "non_existent.txt")
+        self.assertFalse(safe_move(non_existent_s, sub_dir_s))
         
         # Test with invalid inputs
-        self.assertFalse(safe_move("", str(self.sub_dir)))
-        self.assertFalse(safe_move(str(dst_file), ""))
+        self.assertFalse(safe_move("", sub_dir_s))
+        self.assertFalse(safe_move(dst_file_s, ""))
         
         # Test moving a directory (should fail)
-        self.assertFalse(safe_move(str(self.sub_dir), str(self.temp_path / "new_dir")))
+        self.assertFalse(safe_move(sub_dir_s, os.path.join(self.temp_path_s, "new_dir")))
     
     def test_copy_with_meta(self):
+        sub_dir = self.temp_path / "subdir"
+        sub_dir.mkdir()
+
         # Create a file to copy
         src_file = self.temp_path / "copy_me.txt"
-        with open(src_file, "w") as f:
-            f.write("Copy me with metadata")
+        touch(src_file, _COPY_BYTES)
         
         # Set access and modification times
         access_time = 1600000000  # Some timestamp
@@ -398,27 +282,22 @@ class TestSystemIO(unittest.TestCase):
         # Test copying to a new location
         dst_file = self.temp_path / "copied.txt"
         self.assertTrue(copy_with_meta(src_file, dst_file))
-        self.assertTrue(src_file.exists())  # Original should still exist
-        self.assertTrue(dst_file.exists())  # Copy should exist
+        self.assertTrue(os.access(src_file, os.F_OK))  # Original should still exist
+        self.assertTrue(os.access(dst_file, os.F_OK))  # Copy should exist
         
         # Check content
-        with open(dst_file, "r") as f:
-            self.assertEqual(f.read(), "Copy me with metadata")
+        self.assertEqual(dst_file.read_bytes(), _COPY_BYTES)
 
-        # Check metadata (modification time)
-        stat_dst = os.stat(dst_file)
-        self.assertEqual(stat_dst.st_mtime, mod_time)
-        
-        # Check metadata (timestamps)
-        src_stat = os.stat(src_file)
-        dst_stat = os.stat(dst_file)
+        # Check metadata (timestamps), one stat per file
+        src_stat, dst_stat = os.stat(src_file), os.stat(dst_file)
+        self.assertEqual(dst_stat.st_mtime, mod_time)
         self.assertEqual(dst_stat.st_mtime, src_stat.st_mtime)
         
         # Test copying to a non-existent directory (should create it)
         new_dir = self.temp_path / "new_dir"
         dst_file2 = new_dir / "copied.txt"
         self.assertTrue(copy_with_meta(src_file, dst_file2))
-        self.assertTrue(dst_file2.exists())
+        self.assertTrue(os.access(dst_file2, os.F_OK))
         
         # Test with invalid inputs
         self.assertFalse(copy_with_meta("", dst_file))
@@ -429,18 +308,26 @@ class TestSystemIO(unittest.TestCase):
         self.assertFalse(copy_with_meta(non_existent, dst_file))
         
         # Test copying a directory (should fail)
-        self.assertFalse(copy_with_meta(self.sub_dir, dst_file))
+        self.assertFalse(copy_with_meta(sub_dir, dst_file))
+
+    @unittest.skipUnless(os.environ.get("JINNANG_LARGE_IO_TESTS"),
+                         "large I/O test; set JINNANG_LARGE_IO_TESTS=1")
+    def test_copy_with_meta_large_payload(self):
+        # A payload big enough that the copy's buffer size matters
+        src_file = self.temp_path / "large_src.bin"
+        dst_file = self.temp_path / "large_dst.bin"
+        touch(src_file, bytes(_LARGE_PAYLOAD_SIZE))
+
+        self.assertTrue(copy_with_meta(src_file, dst_file))
+        self.assertEqual(os.path.getsize(dst_file), _LARGE_PAYLOAD_SIZE)
     
     def test_inplace_overwrite_meta(self):
         # Create source and target files
-        src_file = self.temp_path / "source_meta.txt"
-        target_file = self.temp_path / "target_meta.txt"
-        
-        with open(src_file, "w") as f:
-            f.write("Source file")
+        src_file = os.path.join(self.temp_path_s, "source_meta.txt")
+        target_file = os.path.join(self.temp_path_s, "target_meta.txt")
         
-        with open(target_file, "w") as f:
-            f.write("Target file")
+        touch(src_file, b"Source file")
+        touch(target_file, _TARGET_BYTES)
         
         # Set different timestamps for source
         access_time = 1600000000  # Some timestamp
@@ -453,16 +340,34 @@ class TestSystemIO(unittest.TestCase):
         # Apply metadata from source to target
         inplace_overwrite_meta(src_file, target_file)
         
-        # Check if timestamps were copied correctly
-        src_stat = os.stat(src_file)
-        target_stat = os.stat(target_file)
+        # Check if timestamps were copied correctly, one stat per file
+        src_stat, target_stat = os.stat(src_file), os.stat(target_file)
         
         self.assertEqual(target_stat.st_mtime, src_stat.st_mtime)
         self.assertEqual(target_stat.st_atime, src_stat.st_atime)
         
         # Content should remain unchanged
-        with open(target_file, "r") as f:
-            self.assertEqual(f.read(), "Target file")
+        self.assertEqual(_read_bytes(target_file), _TARGET_BYTES)
+
+
+class TestWorkerCount(unittest.TestCase):
+    """Pure-logic tests, kept out of TestSystemIO so they skip its file fixtures."""
+
+    @classmethod
+    def setUpClass(cls):
+        # The CPU-count based default is computed once for the class
+        cls.auto_workers = get_worker_num_for_io_bounded_task()
+
+    def test_get_worker_num_for_io_bounded_task_user_defined(self):
+        # Within bounds, below minimum, above maximum
+        for user_defined, expected in [(5, 5), (0, 1), (50, 32)]:
+            with self.subTest(user_defined=user_defined):
+                self.assertEqual(get_worker_num_for_io_bounded_task(user_defined), expected)
+
+    def test_get_worker_num_for_io_bounded_task_auto(self):
+        # We can't assert exact value as it depends on the system's CPU count
+        self.assertGreaterEqual(self.auto_workers, 4)  # Should be at least 4
+        self.assertLessEqual(self.auto_workers, 32)    # Should not exceed 32
 
 
 if __name__ == "__main__":